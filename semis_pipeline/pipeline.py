@@ -10,9 +10,15 @@ from dagster import (
     AssetCheckResult,
     asset_check,
     AssetCheckSeverity,
+    ConfigurableIOManager,
+    InputContext,
+    OutputContext,
+    multiprocess_executor,
 )
 import pandas as pd
 import os
+import logging
+from contextlib import contextmanager
 from typing import List, Dict, Any
 import time
 
@@ -26,6 +32,39 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from scrapers.basketball_reference import main as scrape_basketball_reference
 from scrapers.espn import scrape_espn_nba_leaders
 from processing.cleaning import clean_and_merge_player_data, save_merged_data
+from processing.csv_io import write_csv
+
+DEFAULT_OUTPUT_DIR = "data_outputs"
+
+
+class DagsterLogHandler(logging.Handler):
+    """Forwards Python log records to a Dagster run log"""
+
+    def __init__(self, dagster_log):
+        super().__init__()
+        self.dagster_log = dagster_log
+        # Never write through a forked copy of the run's log from a worker
+        # process; the scrapers hand worker-side problems back to be logged here
+        self.pid = os.getpid()
+
+    def emit(self, record):
+        if os.getpid() == self.pid:
+            self.dagster_log.log(record.levelno, self.format(record))
+
+
+@contextmanager
+def scraper_logs_to(context: AssetExecutionContext, level=logging.INFO):
+    """Sends the scrapers' log messages at `level` and above to the run log"""
+    logger = logging.getLogger("scrapers")
+    handler = DagsterLogHandler(context.log)
+    previous_level = logger.level
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    try:
+        yield
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(previous_level)
 
 
 class DataPipelineConfig(Config):
@@ -33,19 +72,52 @@ class DataPipelineConfig(Config):
 
     max_players_per_letter: int = 100
     espn_url: str = "https://www.espn.com/nba/history/leaders"
-    output_dir: str = "data_outputs"
+    # The Parquet files handed between assets follow the io_manager resource's
+    # own output_dir; set both to move every output together
+    output_dir: str = DEFAULT_OUTPUT_DIR
     br_output_filename: str = "basketball_reference_players.csv"
     espn_output_filename: str = "espn_nba_leaders_pts.csv"
     merged_output_filename: str = "merged_players_data.csv"
+    fast_io: bool = True  # Use the PyArrow CSV reader/writer instead of pandas' default
+
+
+class PandasParquetIOManager(ConfigurableIOManager):
+    """
+    Stores DataFrame assets as Parquet files under <output_dir>/storage for
+    downstream assets and checks
+    """
+
+    output_dir: str = DEFAULT_OUTPUT_DIR
+
+    def _get_path(self, context) -> str:
+        return (
+            os.path.join(self.output_dir, "storage", *context.asset_key.path)
+            + ".parquet"
+        )
+
+    def handle_output(self, context: OutputContext, obj: pd.DataFrame):
+        path = self._get_path(context)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            obj.to_parquet(path, engine="pyarrow", compression="zstd", index=False)
+        except (TypeError, ValueError):
+            # Scraped object columns can mix types (e.g. numeric and "--" points)
+            object_columns = obj.select_dtypes(include="object").columns
+            obj.astype({col: "string" for col in object_columns}).to_parquet(
+                path, engine="pyarrow", compression="zstd", index=False
+            )
+
+    def load_input(self, context: InputContext) -> pd.DataFrame:
+        return pd.read_parquet(self._get_path(context), engine="pyarrow")
 
 
 @asset(group_name="web_scraping")
 def basketball_reference_data(
     context: AssetExecutionContext, config: DataPipelineConfig
-) -> str:
+) -> pd.DataFrame:
     """
     Scrapes basketball reference data for all players (limited per letter).
-    Returns the path to the saved CSV file.
+    Saves a CSV copy and returns the scraped DataFrame.
     """
     context.log.info(
         f"Starting Basketball Reference scraping with max {config.max_players_per_letter} players per letter"
@@ -55,14 +127,15 @@ def basketball_reference_data(
     os.makedirs(config.output_dir, exist_ok=True)
 
     # Run the basketball reference scraper
-    df = scrape_basketball_reference()
+    with scraper_logs_to(context):
+        df = scrape_basketball_reference()
 
     if df is None or df.empty:
         raise Exception("Failed to scrape data from Basketball Reference")
 
     # Save the data
     output_path = os.path.join(config.output_dir, config.br_output_filename)
-    df.to_csv(output_path, index=False, encoding="utf-8-sig")
+    write_csv(df, output_path, fast_io=config.fast_io)
 
     context.log.info(
         f"Successfully scraped {len(df)} players from Basketball Reference"
@@ -80,16 +153,16 @@ def basketball_reference_data(
         }
     )
 
-    return output_path
+    return df
 
 
 @asset(group_name="web_scraping")
 def espn_leaders_data(
     context: AssetExecutionContext, config: DataPipelineConfig
-) -> str:
+) -> pd.DataFrame:
     """
     Scrapes ESPN NBA scoring leaders data.
-    Returns the path to the saved CSV file.
+    Saves a CSV copy and returns the scraped DataFrame.
     """
     context.log.info(f"Starting ESPN scraping from: {config.espn_url}")
 
@@ -97,14 +170,15 @@ def espn_leaders_data(
     os.makedirs(config.output_dir, exist_ok=True)
 
     # Run the ESPN scraper
-    df = scrape_espn_nba_leaders(config.espn_url)
+    with scraper_logs_to(context):
+        df = scrape_espn_nba_leaders(config.espn_url)
 
     if df is None or df.empty:
         raise Exception("Failed to scrape data from ESPN")
 
     # Save the data
     output_path = os.path.join(config.output_dir, config.espn_output_filename)
-    df.to_csv(output_path, index=False)
+    write_csv(df, output_path, fast_io=config.fast_io)
 
     context.log.info(f"Successfully scraped {len(df)} players from ESPN")
     context.log.info(f"Data saved to: {output_path}")
@@ -120,19 +194,19 @@ def espn_leaders_data(
         }
     )
 
-    return output_path
+    return df
 
 
 @asset(group_name="data_processing")
 def cleaned_merged_data(
     context: AssetExecutionContext,
     config: DataPipelineConfig,
-    basketball_reference_data: str,
-    espn_leaders_data: str,
-) -> str:
+    basketball_reference_data: pd.DataFrame,
+    espn_leaders_data: pd.DataFrame,
+) -> pd.DataFrame:
     """
     Cleans and merges basketball reference and ESPN data.
-    Returns the path to the saved merged CSV file.
+    Saves the merged CSV and returns the merged DataFrame.
     """
     context.log.info("Starting data cleaning and merging process")
 
@@ -144,12 +218,12 @@ def cleaned_merged_data(
         basketball_reference_data, espn_leaders_data
     )
 
-    if not merged_data:
+    if merged_data.empty:
         raise Exception("No data was successfully merged")
 
     # Save the merged data
     output_path = os.path.join(config.output_dir, config.merged_output_filename)
-    success = save_merged_data(merged_data, output_path)
+    success = save_merged_data(merged_data, output_path, fast_io=config.fast_io)
 
     if not success:
         raise Exception("Failed to save merged data to CSV")
@@ -168,22 +242,22 @@ def cleaned_merged_data(
             "match_percentage": stats["match_percentage"],
             "file_path": output_path,
             "file_size_bytes": os.path.getsize(output_path),
-            "sample_merged_player": merged_data[0] if merged_data else None,
+            "sample_merged_player": merged_data.head(1).to_dict("records")[0],
         }
     )
 
-    return output_path
+    return merged_data
 
 
 # Data Quality Checks
 @asset_check(asset=basketball_reference_data, blocking=True)
 def basketball_reference_completeness_check(
-    context: AssetExecutionContext, basketball_reference_data: str
+    context: AssetExecutionContext, basketball_reference_data: pd.DataFrame
 ) -> AssetCheckResult:
     """
     Checks that Basketball Reference data has essential fields populated.
     """
-    df = pd.read_csv(basketball_reference_data)
+    df = basketball_reference_data
 
     # Check for required columns
     required_columns = ["Name", "Position", "Height_Imperial", "Born_Date"]
@@ -214,12 +288,12 @@ def basketball_reference_completeness_check(
 
 @asset_check(asset=espn_leaders_data, blocking=True)
 def espn_data_validity_check(
-    context: AssetExecutionContext, espn_leaders_data: str
+    context: AssetExecutionContext, espn_leaders_data: pd.DataFrame
 ) -> AssetCheckResult:
     """
     Checks that ESPN data has valid scoring data.
     """
-    df = pd.read_csv(espn_leaders_data)
+    df = espn_leaders_data
 
     # Check for required columns
     if not all(col in df.columns for col in ["RK", "Player", "PTS"]):
@@ -248,12 +322,12 @@ def espn_data_validity_check(
 
 @asset_check(asset=cleaned_merged_data, blocking=False)
 def merged_data_quality_check(
-    context: AssetExecutionContext, cleaned_merged_data: str
+    context: AssetExecutionContext, cleaned_merged_data: pd.DataFrame
 ) -> AssetCheckResult:
     """
     Checks the quality of the merged dataset.
     """
-    df = pd.read_csv(cleaned_merged_data)
+    df = cleaned_merged_data
 
     # Check that we have both ESPN and Basketball Reference data
     espn_columns = [col for col in df.columns if col.startswith("ESPN_")]
@@ -282,6 +356,8 @@ basketball_pipeline_job = define_asset_job(
     name="basketball_pipeline_job",
     selection=["basketball_reference_data", "espn_leaders_data", "cleaned_merged_data"],
     description="Complete basketball data pipeline: scrape, clean, and merge",
+    # The two scrapers are independent and network-bound, so run them side by side
+    executor_def=multiprocess_executor.configured({"max_concurrent": 4}),
 )
 
 
@@ -337,4 +413,7 @@ defs = Definitions(
         basketball_pipeline_schedule,
         basketball_pipeline_weekly_schedule,
     ],
+    # Assets hand DataFrames to downstream assets and checks as Parquet
+    # (output_dir can be set per run under resources.io_manager.config)
+    resources={"io_manager": PandasParquetIOManager.configure_at_launch()},
 )
@@ -1,5 +1,15 @@
+import numpy as np
 import pandas as pd
 import re
+from collections import Counter, defaultdict
+
+from processing.csv_io import read_csv, write_csv
+
+try:
+    from rapidfuzz import process
+    from rapidfuzz.distance import Indel
+except ImportError:  # Fall back to the pure-Python token matcher
+    process = Indel = None
 
 # Compiled Regex Patterns
 RE_SUFFIXES = re.compile(r"\b(jr|sr|ii|iii|iv|v)\.?\b", re.IGNORECASE)
@@ -14,19 +24,40 @@ RE_COMMA_SPACE = re.compile(r",\s*")
 RE_MONTH_DAY_YEAR = re.compile(r"(\w+)\s+(\d{1,2}),?\s*(\d{4})", re.IGNORECASE)
 RE_YYYY_MM_DD = re.compile(r"\d{4}-\d{2}-\d{2}")
 RE_MM_DD_YYYY = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+# Anchored like re.match, for the vectorized Series.str.extract versions
+RE_MONTH_DAY_YEAR_START = re.compile(r"^(\w+)\s+(\d{1,2}),?\s*(\d{4})", re.IGNORECASE)
+RE_MM_DD_YYYY_START = re.compile(r"^(\d{1,2})/(\d{1,2})/(\d{4})")
 
 RE_HEIGHT_MONTH_WORDS = re.compile(r"\b(month|months|mo|mos|m)\b", re.IGNORECASE)
 RE_HEIGHT_MONTH_ABBRS = re.compile(
     r"\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\b", re.IGNORECASE
 )
+_MONTH_ABBRS = "jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec"
+RE_EXCEL_DATE = re.compile(
+    rf"-({_MONTH_ABBRS})|({_MONTH_ABBRS})(?=-)", re.IGNORECASE
+)  # Excel-mangled heights such as "6-Jun" or "Jul-7"
 RE_HEIGHT_FT_IN = re.compile(r"(\d+)['\s]*[-\s]*(\d+)")
 RE_HEIGHT_FT_ONLY = re.compile(r"(\d+)['\s]*(?:ft|feet)?")
 
+# Fuzzy matching only compares names whose token counts differ by at most this
+FUZZY_MAX_TOKEN_COUNT_GAP = 1
+
 # Name replacements
 NAME_REPLACEMENTS = {
     "shaquille oneal": "shaquille o'neal",
 }
 
+# Merged output: ESPN Rank/Points and the BR Name up front, then all other BR columns
+MERGED_LEADING_COLUMNS = ["ESPN_Rank", "Name", "ESPN_Points"]
+# Internal fields that never belong in the merged output
+MERGED_INTERNAL_COLUMNS = {
+    "Normalized_Name",
+    "Normalized_ESPN_Name",
+    "ESPN_Player_Name",
+    "Match_Type",
+    "Matched_BR_Name",
+}
+
 # Month name to number mapping (lowercase keys)
 MONTH_TO_NUM_MAP = {
     "january": "01",
@@ -92,26 +123,76 @@ def normalize_name(name):
     return name_str
 
 
-def fuzzy_name_match(espn_name, br_names_normalized_parts_list, threshold=0.8):
+def name_tokens(normalized_name):
+    """Token set of a normalized name, as used by the fuzzy matchers."""
+    return frozenset(normalized_name.split())
+
+
+def normalize_names(names):
+    """Vectorized ``normalize_name`` over a Series of names."""
+    names = names.fillna("").astype(str).str.strip().str.lower()
+    names = names.str.replace(RE_SUFFIXES, "", regex=True)
+
+    for variant, standard in NAME_REPLACEMENTS.items():
+        names = names.str.replace(variant, standard, regex=False)
+
+    names = names.str.replace(RE_PUNCTUATION, "", regex=True)
+    names = names.str.replace(RE_MULTIPLE_SPACES, " ", regex=True).str.strip()
+
+    return names
+
+
+def build_name_token_index(br_names_normalized_parts_list):
+    """Maps every name token to the positions of the BR names containing it."""
+    token_index = defaultdict(list)
+    for idx, (_, br_parts_set) in enumerate(br_names_normalized_parts_list):
+        for part in br_parts_set:
+            token_index[part].append(idx)
+    return token_index
+
+
+def fuzzy_name_match(
+    espn_name, br_names_normalized_parts_list, threshold=0.8, *, token_index
+):
+    """
+    Matches one ESPN name against the BR names. token_index must be
+    build_name_token_index(br_names_normalized_parts_list), built once by the
+    caller and reused for every name rather than rebuilt per call.
+    """
     espn_normalized = normalize_name(espn_name)
     if not espn_normalized:
         return None
 
-    espn_parts = espn_normalized.split()
+    return _best_token_match(
+        espn_normalized.split(), br_names_normalized_parts_list, threshold, token_index
+    )
+
+
+def _best_token_match(
+    espn_parts, br_names_normalized_parts_list, threshold, token_index
+):
     if not espn_parts:  # Handles names that normalize to empty or whitespace only
         return None
 
+    # Only BR names sharing at least one token with the ESPN name, and with a
+    # similar number of tokens, are worth scoring
+    num_parts = len(espn_parts)
+    candidate_matches = Counter(
+        idx
+        for part in espn_parts
+        for idx in token_index.get(part, ())
+        if abs(len(br_names_normalized_parts_list[idx][1]) - num_parts)
+        <= FUZZY_MAX_TOKEN_COUNT_GAP
+    )
+
     min_match_score = len(espn_parts) * threshold
 
     best_match_name = None
     highest_score = -1
 
-    for original_br_name, br_parts_set in br_names_normalized_parts_list:
-        # Ensure br_parts_set is not empty to avoid issues if a BR name normalized to empty
-        if not br_parts_set:
-            continue
-
-        matches = sum(1 for part in espn_parts if part in br_parts_set)
+    # Visit candidates in list order so ties still resolve to the first BR name
+    for idx in sorted(candidate_matches):
+        matches = candidate_matches[idx]
 
         # Prefer exact subset matches first if they meet threshold
         if matches >= min_match_score:
@@ -123,7 +204,7 @@ def fuzzy_name_match(espn_name, br_names_normalized_parts_list, threshold=0.8):
             # This prioritizes names that have a higher proportion of their parts matched.
             if current_score > highest_score:
                 highest_score = current_score
-                best_match_name = original_br_name
+                best_match_name = br_names_normalized_parts_list[idx][0]
                 # If it's a perfect match of all parts, take it immediately
                 if current_score == 1.0:
                     return best_match_name
@@ -131,6 +212,70 @@ def fuzzy_name_match(espn_name, br_names_normalized_parts_list, threshold=0.8):
     return best_match_name
 
 
+def fuzzy_match_names(espn_names, br_names, threshold=0.8):
+    """
+    Fuzzy-matches normalized ESPN names against normalized BR names in one batch,
+    using the same rule as fuzzy_name_match: at least `threshold` of the ESPN
+    name's tokens must appear in the BR name. Returns a dict mapping each matched
+    ESPN name to its best BR name.
+    """
+    if not espn_names or not br_names:
+        return {}
+
+    br_names_normalized_parts_list = [(name, name_tokens(name)) for name in br_names]
+    espn_parts = [espn_name.split() for espn_name in espn_names]
+    matches = {}
+
+    if process is None:
+        token_index = build_name_token_index(br_names_normalized_parts_list)
+        for espn_name, parts in zip(espn_names, espn_parts):
+            # Names are already normalized, so skip straight to token scoring
+            br_name = _best_token_match(
+                parts, br_names_normalized_parts_list, threshold, token_index
+            )
+            if br_name:
+                matches[espn_name] = br_name
+        return matches
+
+    # Sorted lists of distinct tokens have a longest common subsequence exactly
+    # as long as their intersection, so the Indel distance between them gives
+    # the number of ESPN tokens found in each BR name
+    br_sorted_parts = [sorted(parts) for _, parts in br_names_normalized_parts_list]
+    distances = process.cdist(
+        [sorted(parts) for parts in espn_parts],
+        br_sorted_parts,
+        scorer=Indel.distance,
+        workers=-1,
+    )
+    espn_lengths = np.array([len(parts) for parts in espn_parts])[:, np.newaxis]
+    br_lengths = np.array([len(parts) for parts in br_sorted_parts])[np.newaxis, :]
+    shared_tokens = (espn_lengths + br_lengths - distances) // 2
+    shared_tokens[np.abs(br_lengths - espn_lengths) > FUZZY_MAX_TOKEN_COUNT_GAP] = 0
+    # argmax picks the first BR name among equal scores, like _best_token_match
+    best_indices = shared_tokens.argmax(axis=1)
+
+    token_index = None
+    for espn_name, parts, row_shared, best_idx in zip(
+        espn_names, espn_parts, shared_tokens, best_indices
+    ):
+        if len(set(parts)) < len(parts):
+            # A repeated ESPN token counts once per occurrence, which the
+            # intersection above cannot express; score this name the slow way
+            if token_index is None:
+                token_index = build_name_token_index(br_names_normalized_parts_list)
+            br_name = _best_token_match(
+                parts, br_names_normalized_parts_list, threshold, token_index
+            )
+            if br_name:
+                matches[espn_name] = br_name
+        elif (
+            row_shared[best_idx] > 0 and row_shared[best_idx] >= len(parts) * threshold
+        ):
+            matches[espn_name] = br_names[best_idx]
+
+    return matches
+
+
 def format_born_location(location):
     if pd.isna(location):
         return ""
@@ -143,6 +288,16 @@ def format_born_location(location):
     return location_str.strip()
 
 
+def format_born_locations(locations):
+    """Vectorized ``format_born_location`` over a Series of locations."""
+    locations = locations.fillna("").astype(str).str.strip()
+    locations = locations.str.replace(RE_BORN_PREFIX, "", regex=True)
+    locations = locations.str.replace(RE_MULTIPLE_SPACES, " ", regex=True)
+    locations = locations.str.replace(RE_COMMA_SPACE, ", ", regex=True)
+
+    return locations.str.strip()
+
+
 def standardize_date_format(date_str):
     if pd.isna(date_str):
         return ""
@@ -167,27 +322,43 @@ def standardize_date_format(date_str):
     return date_str
 
 
-def standardize_height_imperial(height_str):
-    if pd.isna(height_str):
-        return ""
+def standardize_dates(dates):
+    """Vectorized ``standardize_date_format`` over a Series of dates."""
+    dates = dates.fillna("").astype(str).str.strip()
 
-    height_str = str(height_str).strip()
+    # Already-ISO values pass straight through; only the rest are parsed, with
+    # the scalar version's precedence: month-name dates (including the scraped
+    # "December 30,1984") before MM/DD/YYYY, anything else left unchanged
+    is_iso = dates.str.len().eq(10) & dates.str.match(RE_YYYY_MM_DD)
+    to_parse = dates[~is_iso]
 
-    for month_abbr, month_num in EXCEL_DATE_TO_HEIGHT_CONVERSIONS.items():
-        # Pattern for "-Jun" -> "-6"
-        height_str = re.sub(
-            f"-{month_abbr}", f"-{month_num}", height_str, flags=re.IGNORECASE
-        )
-        # Pattern for "Jul-" -> "7-"
-        height_str = re.sub(
-            f"{month_abbr}-", f"{month_num}-", height_str, flags=re.IGNORECASE
-        )
+    month_day_year = to_parse.str.extract(RE_MONTH_DAY_YEAR_START)
+    month_num = month_day_year[0].str.lower().map(MONTH_TO_NUM_MAP)
+    from_month_name = (
+        month_day_year[2] + "-" + month_num + "-" + month_day_year[1].str.zfill(2)
+    )
+
+    mm_dd_yyyy = to_parse.str.extract(RE_MM_DD_YYYY_START)
+    from_slashes = (
+        mm_dd_yyyy[2]
+        + "-"
+        + mm_dd_yyyy[0].str.zfill(2)
+        + "-"
+        + mm_dd_yyyy[1].str.zfill(2)
+    )
+
+    return dates.where(is_iso, from_month_name.fillna(from_slashes).fillna(to_parse))
+
+
+def _excel_date_sub(match):
+    # "-Jun" -> "-6", "Jul-" -> "7-" (the trailing hyphen is only looked ahead at)
+    leading_month, trailing_month = match.groups()
+    if leading_month:
+        return f"-{EXCEL_DATE_TO_HEIGHT_CONVERSIONS[leading_month.lower()]}"
+    return EXCEL_DATE_TO_HEIGHT_CONVERSIONS[trailing_month.lower()]
 
-    height_str = RE_HEIGHT_MONTH_WORDS.sub("", height_str)
-    height_str = RE_HEIGHT_MONTH_ABBRS.sub(
-        "", height_str
-    )  # Clean up any loose month names
 
+def _format_height(height_str):
     match = RE_HEIGHT_FT_IN.search(height_str)
     if match:
         feet, inches = match.groups()
@@ -205,123 +376,131 @@ def standardize_height_imperial(height_str):
     return height_str.strip()
 
 
-def _create_ordered_merged_player_entry(br_player_info, espn_row_data):
-    player_data = br_player_info.copy()
-    if "Normalized_Name" in player_data:  # Internal field
-        del player_data["Normalized_Name"]
+def standardize_height_imperial(height_str):
+    if pd.isna(height_str):
+        return ""
+
+    height_str = str(height_str).strip()
+    height_str = RE_EXCEL_DATE.sub(_excel_date_sub, height_str)
+
+    height_str = RE_HEIGHT_MONTH_WORDS.sub("", height_str)
+    height_str = RE_HEIGHT_MONTH_ABBRS.sub(
+        "", height_str
+    )  # Clean up any loose month names
+
+    return _format_height(height_str)
+
 
-    player_data["ESPN_Rank"] = espn_row_data["RK"]
-    player_data["ESPN_Points"] = espn_row_data["PTS"]
+def standardize_heights(heights):
+    """Vectorized ``standardize_height_imperial`` over a Series of heights."""
+    heights = heights.fillna("").astype(str).str.strip()
+    heights = heights.str.replace(RE_EXCEL_DATE, _excel_date_sub, regex=True)
+    heights = heights.str.replace(RE_HEIGHT_MONTH_WORDS, "", regex=True)
+    heights = heights.str.replace(RE_HEIGHT_MONTH_ABBRS, "", regex=True)
 
-    ordered_entry = {}
-    ordered_entry["ESPN_Rank"] = player_data["ESPN_Rank"]
-    ordered_entry["Name"] = player_data["Name"]
-    ordered_entry["ESPN_Points"] = player_data["ESPN_Points"]
+    # Same precedence as _format_height: feet-inches, then feet only, then raw
+    feet_inches = heights.str.extract(RE_HEIGHT_FT_IN)
+    feet_only = heights.str.extract(RE_HEIGHT_FT_ONLY, expand=False)
+    unmatched = heights.str.replace(RE_MULTIPLE_SPACES, "", regex=True).str.strip()
 
-    for key, value in player_data.items():
-        if key not in ordered_entry:
-            ordered_entry[key] = value
+    return (
+        (feet_inches[0] + "-" + feet_inches[1])
+        .fillna(feet_only + "-0")
+        .fillna(unmatched)
+    )
 
-    return ordered_entry
 
+def _load_player_data(data, fast_io=True):
+    # Accept an already-loaded DataFrame (e.g. from a Dagster asset) or a CSV path
+    if isinstance(data, pd.DataFrame):
+        return data.copy()
+    return read_csv(data, fast_io=fast_io)
 
-def clean_and_merge_player_data(br_csv_path, espn_csv_path):
+
+def clean_and_merge_player_data(br_data, espn_data, fast_io=True):
     try:
-        br_df = pd.read_csv(br_csv_path)
-        espn_df = pd.read_csv(espn_csv_path)
+        br_df = _load_player_data(br_data, fast_io=fast_io)
+        espn_df = _load_player_data(espn_data, fast_io=fast_io)
         print(f"Loaded {len(br_df)} players from Basketball Reference")
         print(f"Loaded {len(espn_df)} players from ESPN leaders")
     except Exception as e:
         print(f"Error loading CSV files: {e}")
-        return [], [], {}
+        return pd.DataFrame(), pd.DataFrame(), {}
 
     print("\nProcessing Basketball Reference data...")
-    br_df["Born_Location"] = br_df["Born_Location"].apply(format_born_location)
-    br_df["Born_Date"] = br_df["Born_Date"].apply(standardize_date_format)
-    br_df["NBA_Debut"] = br_df["NBA_Debut"].apply(standardize_date_format)
-    br_df["Height_Imperial"] = br_df["Height_Imperial"].apply(
-        standardize_height_imperial
-    )
+    br_df["Born_Location"] = format_born_locations(br_df["Born_Location"])
+    br_df["Born_Date"] = standardize_dates(br_df["Born_Date"])
+    br_df["NBA_Debut"] = standardize_dates(br_df["NBA_Debut"])
+    br_df["Height_Imperial"] = standardize_heights(br_df["Height_Imperial"])
 
     columns_to_remove_br = ["Pronunciation", "High School", "College", "Draft", "URL"]
     br_df = br_df.drop(columns=columns_to_remove_br, errors="ignore")
 
-    br_df["Normalized_Name"] = br_df["Name"].apply(normalize_name)
+    br_df["Normalized_Name"] = normalize_names(br_df["Name"])
 
-    br_lookup = {}
-    for _, row in br_df.iterrows():
-        normalized = row["Normalized_Name"]
-        if (
-            normalized and normalized not in br_lookup
-        ):  # Store first encountered for a given normalized name
-            br_lookup[normalized] = row.to_dict()
+    # Row position of the first encountered row for a given normalized name
+    br_names = br_df["Normalized_Name"]
+    is_first = br_names.ne("") & ~br_names.duplicated()
+    br_lookup = dict(zip(br_names[is_first], np.flatnonzero(is_first)))
     print(f"Created lookup for {len(br_lookup)} unique normalized BR names")
 
-    # Pre-process BR names for fuzzy matching
-    br_names_for_fuzzy_prepped = []
-    # Use unique names from br_df to avoid redundant processing for fuzzy list
-    # If 'Name' can be NaN, ensure it's handled or dropped before unique()
-    unique_br_names = br_df["Name"].dropna().unique()
-    for name in unique_br_names:
-        normalized_name_str = normalize_name(name)
-        if normalized_name_str:  # Ensure not empty
-            br_names_for_fuzzy_prepped.append((name, set(normalized_name_str.split())))
-
     print("\nProcessing ESPN scoring leaders...")
-    espn_df["Normalized_ESPN_Name"] = espn_df["Player"].apply(normalize_name)
-
-    merged_data = []
-    unmatched_players = []
-    exact_matches = 0
-    fuzzy_matches = 0
-
-    for _, espn_row in espn_df.iterrows():
-        espn_normalized = espn_row["Normalized_ESPN_Name"]
-        br_player_info = None
-
-        if espn_normalized and espn_normalized in br_lookup:
-            br_player_info = br_lookup[espn_normalized]
-            exact_matches += 1
-        else:
-            fuzzy_match_original_br_name = fuzzy_name_match(
-                espn_row["Player"], br_names_for_fuzzy_prepped
-            )
-            if fuzzy_match_original_br_name:
-                # We have the original BR name, get its normalized form to lookup in br_lookup
-                normalized_fuzzy_br_name = normalize_name(fuzzy_match_original_br_name)
-                if normalized_fuzzy_br_name in br_lookup:
-                    br_player_info = br_lookup[normalized_fuzzy_br_name]
-                    fuzzy_matches += 1
-
-        if br_player_info:
-            ordered_entry = _create_ordered_merged_player_entry(
-                br_player_info, espn_row
-            )
-            merged_data.append(ordered_entry)
-        else:
-            unmatched_players.append(
-                {
-                    "ESPN_Player": espn_row["Player"],
-                    "ESPN_Rank": espn_row["RK"],
-                    "ESPN_Points": espn_row["PTS"],
-                    "Normalized_Name": espn_normalized,  # For debugging unmatched
-                }
-            )
+    espn_names = normalize_names(espn_df["Player"])
+    exact_idx = espn_names.map(br_lookup)
+    is_exact = exact_idx.notna()
+
+    # Fuzzy-match every name without an exact match in a single batch
+    unmatched_espn_names = [name for name in espn_names[~is_exact].unique() if name]
+    fuzzy_lookup = fuzzy_match_names(unmatched_espn_names, list(br_lookup))
+
+    matched_idx = exact_idx.fillna(espn_names.map(fuzzy_lookup).map(br_lookup))
+    is_matched = matched_idx.notna()
+
+    # Gather every matched BR row at once and line it up with its ESPN row
+    matched_br = br_df.iloc[matched_idx[is_matched].to_numpy(dtype=int)]
+    merged_df = pd.concat(
+        [
+            espn_df.loc[is_matched, ["RK", "PTS"]]
+            .rename(columns={"RK": "ESPN_Rank", "PTS": "ESPN_Points"})
+            .reset_index(drop=True),
+            matched_br.reset_index(drop=True),
+        ],
+        axis=1,
+    )
 
+    other_cols = [
+        col
+        for col in merged_df.columns
+        if col not in MERGED_LEADING_COLUMNS and col not in MERGED_INTERNAL_COLUMNS
+    ]
+    merged_df = merged_df.reindex(columns=MERGED_LEADING_COLUMNS + other_cols)
+
+    unmatched_df = pd.DataFrame(
+        {
+            "ESPN_Player": espn_df.loc[~is_matched, "Player"],
+            "ESPN_Rank": espn_df.loc[~is_matched, "RK"],
+            "ESPN_Points": espn_df.loc[~is_matched, "PTS"],
+            "Normalized_Name": espn_names[~is_matched],  # For debugging unmatched
+        }
+    ).reset_index(drop=True)
+
+    exact_matches = int(is_exact.sum())
     stats = {
         "total_espn_players": len(espn_df),
         "total_br_players": len(br_df),  # Could be len(br_lookup) for unique normalized
         "exact_matches": exact_matches,
-        "fuzzy_matches": fuzzy_matches,
-        "total_matches": len(merged_data),
-        "unmatched": len(unmatched_players),
+        "fuzzy_matches": len(merged_df) - exact_matches,
+        "total_matches": len(merged_df),
+        "unmatched": len(unmatched_df),
     }
     if len(espn_df) > 0:
-        stats["match_percentage"] = (len(merged_data) / len(espn_df)) * 100
+        stats["match_percentage"] = (len(merged_df) / len(espn_df)) * 100
     else:
         stats["match_percentage"] = 0.0
 
-    return merged_data, unmatched_players, stats
+    # Both frames keep the ESPN page order, which is already rank order (tied
+    # players have a blank rank, so re-sorting on it would push them to the end)
+    return merged_df, unmatched_df, stats
 
 
 def print_merge_results(merged_data, unmatched_players, stats):
@@ -336,49 +515,33 @@ def print_merge_results(merged_data, unmatched_players, stats):
     print(f"Unmatched players: {stats['unmatched']}")
     print(f"Match success rate: {stats['match_percentage']:.1f}%")
 
-    if merged_data:
+    if not merged_data.empty:
         print("\n" + "-" * 60)
         print("SUCCESSFULLY MATCHED PLAYERS (Sorted by ESPN Rank):")
         print("-" * 60)
-        # Sort merged_data by 'ESPN_Rank' for printing
-        for player in sorted(merged_data, key=lambda x: x["ESPN_Rank"]):
+        for player in merged_data.to_dict("records"):
             br_name = player.get("Name", "N/A")
             print(
                 f"{player['ESPN_Rank']:2d}. {br_name:<30} ({player['ESPN_Points']:,} pts)"
             )
 
-    if unmatched_players:
+    if not unmatched_players.empty:
         print("\n" + "-" * 60)
         print("UNMATCHED PLAYERS (Sorted by ESPN Rank):")
         print("-" * 60)
-        for player in sorted(unmatched_players, key=lambda x: x["ESPN_Rank"]):
+        for player in unmatched_players.to_dict("records"):
             print(
                 f"{player['ESPN_Rank']:2d}. {player['ESPN_Player']:<30} ({player['ESPN_Points']:,} pts) (Normalized: {player['Normalized_Name']})"
             )
 
 
-def save_merged_data(merged_data_list, output_path):
-    if not merged_data_list:
+def save_merged_data(merged_df, output_path, fast_io=True):
+    if merged_df.empty:
         print("No merged data to save.")
         return False
 
-    df = pd.DataFrame(merged_data_list)
-
-    # Define desired column order for the CSV
-    # Start with specific ESPN/BR columns, then all others dynamically
-    # This ensures Name comes from BR, and ESPN Rank/Points are prominent
-    cols_ordered = ["ESPN_Rank", "Name", "ESPN_Points"]
-
-    # Get other columns from the DataFrame, excluding those already in cols_ordered
-    # and ensuring they exist in the DataFrame (though df.columns guarantees this)
-    other_cols = [col for col in df.columns if col not in cols_ordered]
-    final_columns = cols_ordered + other_cols
-
-    # Reorder DataFrame columns for consistent output
-    df = df[final_columns]
-
     try:
-        df.to_csv(output_path, index=False)
+        write_csv(merged_df, output_path, fast_io=fast_io)
         print(f"\nMerged data saved to: {output_path}")
         return True
     except Exception as e:
@@ -398,23 +561,18 @@ def main():
 
     print_merge_results(merged_data, unmatched_players, stats)
 
-    if merged_data:
+    if not merged_data.empty:
         save_successful = save_merged_data(merged_data, output_path)
 
         if save_successful:
             print("\n" + "-" * 60)
             print("SAMPLE OF MERGED DATA (first player from sorted list):")
             print("-" * 60)
-            # Use the first player from the rank-sorted list for sample display
-            sample_player = sorted(merged_data, key=lambda x: x["ESPN_Rank"])[0]
+            # merged_data is in ESPN page (rank) order, so the first row is the sample
+            sample_player = merged_data.iloc[0]
             for key, value in sample_player.items():
                 # Filter out any potential internal fields if they were to be added later
-                if key not in [
-                    "Normalized_Name",
-                    "ESPN_Player_Name",
-                    "Match_Type",
-                    "Matched_BR_Name",
-                ]:
+                if key not in MERGED_INTERNAL_COLUMNS:
                     print(f"  {key}: {value}")
 
     return merged_data, unmatched_players, stats
@@ -0,0 +1,43 @@
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # Fall back to the default pandas engine
+    pa = pa_csv = None
+
+# Buffer size and row chunking for the pandas CSV write path
+WRITE_BUFFER_SIZE = 1024 * 1024
+WRITE_CHUNKSIZE = 50_000
+
+
+def read_csv(path, fast_io=True):
+    """
+    Reads a CSV file, using the multithreaded PyArrow reader when fast_io is set.
+    """
+    if fast_io and pa is not None:
+        return pd.read_csv(path, engine="pyarrow")
+    return pd.read_csv(path)
+
+
+def write_csv(df, path, fast_io=True, **to_csv_kwargs):
+    """
+    Writes a DataFrame to a UTF-8 CSV (no BOM) without the index, using PyArrow
+    when fast_io is set. The pandas path streams rows in chunks through a
+    buffered file handle; extra keyword arguments are passed to DataFrame.to_csv.
+    """
+    if fast_io and pa is not None:
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass  # Mixed-type object columns; let pandas stringify them instead
+        else:
+            pa_csv.write_csv(table, path)
+            return
+
+    to_csv_kwargs.setdefault("chunksize", WRITE_CHUNKSIZE)
+    to_csv_kwargs.setdefault("lineterminator", "\n")
+    with open(
+        path, "w", encoding="utf-8", newline="", buffering=WRITE_BUFFER_SIZE
+    ) as f:
+        df.to_csv(f, index=False, **to_csv_kwargs)
@@ -1,36 +1,166 @@
+import asyncio
+import csv
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 import requests
-from bs4 import BeautifulSoup
+from datetime import timedelta
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
 import pandas as pd
+from scrapers.http_session import configure_session
+import threading
 import time
+import traceback
 import string
 import re
 
+try:
+    import requests_cache
+except ImportError:  # Fall back to an uncached session
+    requests_cache = None
+
 # from pprint import pprint # Not used for printing details anymore
 
+log = logging.getLogger(__name__)
+
 BASE_URL = "https://www.basketball-reference.com"
+REQUEST_DELAY = 3  # seconds, as per robots.txt
+MAX_CONCURRENT_REQUESTS = 4
+# A parse takes about a millisecond against a 3 s request slot, so a couple of
+# workers keep up; they are spawned rather than forked from a process whose
+# fetch threads may be holding locks or SQLite connections
+PARSE_WORKERS = 2
+CACHE_NAME = "br_cache"
+CACHE_EXPIRE_AFTER = timedelta(days=7)
+
+# Height/weight paragraph, e.g. "6-9, 250lb (206cm, 113kg)"
+HT_WT_RE = re.compile(
+    r'(\d+-\d+|\d+\'\d+"?)\s*,\s*(\d+lb)\s*\(([^,]+cm)\s*,\s*([^)]+kg)\)'
+)
+
+
+def _build_session():
+    """
+    Shared session so every page reuses pooled keep-alive connections. When
+    requests-cache is installed, responses are also kept in a SQLite cache so
+    re-runs read unchanged pages from disk. Expired pages are revalidated with
+    If-None-Match/If-Modified-Since, so an unchanged page comes back as a 304
+    without its body, and a failed refresh falls back to the stale copy.
+    """
+    if requests_cache is not None:
+        session = requests_cache.CachedSession(
+            CACHE_NAME,
+            expire_after=CACHE_EXPIRE_AFTER,
+            cache_control=True,
+            allowable_codes=[200],
+            stale_if_error=True,
+        )
+    else:
+        session = requests.Session()
+    # Everything goes to one host: a single pool holding one kept-alive
+    # connection per concurrent request, never opening more than that
+    return configure_session(
+        session,
+        pool_connections=1,
+        pool_maxsize=MAX_CONCURRENT_REQUESTS,
+        pool_block=True,
+    )
+
+
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session():
+    """
+    Builds the shared session on first use, so merely importing this module
+    (Dagster loading the pipeline, parse worker processes) creates no cache file.
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            _SESSION = _build_session()
+        return _SESSION
+
+
+# Index pages only need the player table
+PLAYERS_TABLE_STRAINER = SoupStrainer("table", id="players")
+
+# Player pages are parsed straight into lxml, stopping once the #info div near
+# the top is complete; the XPaths are compiled once and reused for every page
+INFO_FEED_SIZE = 16 * 1024  # bytes fed to the parser between checks for #info
+XPATH_META = etree.XPath(".//div[@id='meta']")
+XPATH_H1 = etree.XPath(".//h1")
+XPATH_CONTENT_DIVS = etree.XPath(
+    "./div[not(contains(concat(' ', normalize-space(@class), ' '), ' media-item '))]"
+)
+XPATH_PARAS = etree.XPath("./p")
+XPATH_STRONG = etree.XPath(".//strong")
+XPATH_BIRTH = etree.XPath(".//span[@id='necro-birth']")
+XPATH_LINKS = etree.XPath(".//a")
+
+
+class RateLimiter:
+    """
+    Keeps requests at least `delay` seconds apart across threads. Unlike a fixed
+    sleep after each request, wait() only sleeps for whatever part of the delay
+    has not already been spent downloading or parsing.
+    """
+
+    def __init__(self, delay):
+        self.delay = delay
+        self._lock = threading.Lock()
+        self._next_request = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            if now < self._next_request:
+                time.sleep(self._next_request - now)
+                now = self._next_request
+            self._next_request = now + self.delay
+
+
+RATE_LIMITER = RateLimiter(REQUEST_DELAY)
+
+
+def _is_cached(url):
+    """True when the session can answer a GET for url from its cache."""
+    cache = getattr(_get_session(), "cache", None)
+    if cache is None:
+        return False
+    cached = cache.get_response(cache.create_key(requests.Request("GET", url)))
+    return cached is not None and not cached.is_expired
+
+
+def _get(url):
+    """GETs url through the shared session, pacing only requests that hit the site."""
+    if not _is_cached(url):
+        RATE_LIMITER.wait()
+    return _get_session().get(url, timeout=15)
 
 
 # get_player_page_urls_from_index and parse_player_page functions remain the same
 # ... (keep the existing get_player_page_urls_from_index and parse_player_page functions here) ...
 def get_player_page_urls_from_index(letter_index_url):
     player_urls = []
-    print(f"Fetching player list from: {letter_index_url}")
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-    }
+    log.info("Fetching player list from: %s", letter_index_url)
     try:
-        response = requests.get(letter_index_url, headers=headers, timeout=15)
+        response = _get(letter_index_url)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = BeautifulSoup(
+            response.content, "lxml", parse_only=PLAYERS_TABLE_STRAINER
+        )
 
         player_table = soup.find("table", id="players")
         if not player_table:
-            print(f"  Could not find player table on {letter_index_url}")
+            log.warning("Could not find player table on %s", letter_index_url)
             return []
 
         tbody = player_table.find("tbody")
         if not tbody:
-            print(f"  Could not find tbody in player table on {letter_index_url}")
+            log.warning("Could not find tbody in player table on %s", letter_index_url)
             return []
 
         for row in tbody.find_all("tr"):
@@ -39,16 +169,142 @@ def get_player_page_urls_from_index(letter_index_url):
                 link_tag = first_cell.find("a")
                 if link_tag and link_tag.get("href"):
                     player_urls.append(BASE_URL + link_tag["href"])
-        print(f"  Found {len(player_urls)} players on this page.")
+        log.info("Found %d players on %s", len(player_urls), letter_index_url)
     except requests.RequestException as e:
-        print(f"  Error fetching {letter_index_url}: {e}")
-    except Exception as e:
-        print(f"  Error parsing {letter_index_url}: {e}")
+        log.error("Error fetching %s: %s", letter_index_url, e)
+    except Exception:
+        log.exception("Error parsing %s", letter_index_url)
     return player_urls
 
 
-def parse_player_page(player_url):
-    print(f"  Scraping player page: {player_url}")
+def _text(node):
+    """lxml counterpart of BeautifulSoup's ``get_text(strip=True)``."""
+    if not isinstance(node.tag, str):  # Comments carry no visible text
+        return ""
+    return "".join(s.strip() for s in node.itertext())
+
+
+def _sibling_texts(node):
+    """Stripped text of everything following node inside its parent, in order."""
+    texts = [(node.tail or "").strip()]
+    for sibling in node.itersiblings():
+        texts.append(_text(sibling))
+        texts.append((sibling.tail or "").strip())
+    return texts
+
+
+# Each handler fills player_data from one labelled <p> (e.g. "Born:") and is called
+# as handler(player_data, p_tag, strong_tag, value_text, value_parts), where
+# value_parts is _sibling_texts(strong_tag), collected once per paragraph
+def _parse_pronunciation(player_data, p_tag, strong_tag, value_text, value_parts):
+    if player_data["Pronunciation"] is None:  # Keep the first one only
+        player_data["Pronunciation"] = value_text
+
+
+def _parse_position_shoots(player_data, p_tag, strong_tag, value_text, value_parts):
+    p_text_full = _text(p_tag).replace("\xa0", " ")
+    for part in p_text_full.split("▪"):
+        if "Position:" in part:
+            player_data["Position"] = part.split("Position:", 1)[-1].strip()
+        elif "Shoots:" in part:
+            player_data["Shoots"] = part.split("Shoots:", 1)[-1].strip()
+
+
+def _parse_born(player_data, p_tag, strong_tag, value_text, value_parts):
+    born_date_spans = XPATH_BIRTH(p_tag)
+    if born_date_spans:
+        player_data["Born_Date"] = _text(born_date_spans[0])
+
+    start_node = born_date_spans[0] if born_date_spans else strong_tag
+    location_parts = [(start_node.tail or "").strip()]
+    for elem in start_node.itersiblings():
+        if elem.tag == "span" and "f-i" in elem.get("class", "").split():
+            break
+        location_parts.append(_text(elem))
+        location_parts.append((elem.tail or "").strip())
+    location = " ".join(filter(None, location_parts)).strip()
+    if location.lower().startswith("in "):
+        location = location[3:]
+    player_data["Born_Location"] = location
+
+
+def _parse_college(player_data, p_tag, strong_tag, value_text, value_parts):
+    college_links = XPATH_LINKS(p_tag)
+    player_data["College"] = (
+        ", ".join([_text(a) for a in college_links]) if college_links else value_text
+    )
+
+
+def _parse_high_school(player_data, p_tag, strong_tag, value_text, value_parts):
+    player_data["High School"] = " ".join(filter(None, value_parts)).lstrip(":").strip()
+
+
+def _parse_draft(player_data, p_tag, strong_tag, value_text, value_parts):
+    player_data["Draft"] = value_text
+
+
+def _parse_nba_debut(player_data, p_tag, strong_tag, value_text, value_parts):
+    debut_links = XPATH_LINKS(p_tag)
+    player_data["NBA_Debut"] = _text(debut_links[0]) if debut_links else value_text
+
+
+def _parse_career_length(player_data, p_tag, strong_tag, value_text, value_parts):
+    player_data["Career_Length"] = value_text
+
+
+# Keyed on the <strong> label without its trailing colon
+LABEL_HANDLERS = {
+    "Pronunciation": _parse_pronunciation,
+    "Position": _parse_position_shoots,
+    "Shoots": _parse_position_shoots,
+    "Born": _parse_born,
+    "College": _parse_college,
+    "Colleges": _parse_college,
+    "High School": _parse_high_school,
+    "Draft": _parse_draft,
+    "NBA Debut": _parse_nba_debut,
+    "Career Length": _parse_career_length,
+}
+
+
+def fetch_player_page(player_url):
+    """Downloads a player page, returning its HTML bytes or None on failure."""
+    log.debug("Scraping player page: %s", player_url)
+    try:
+        response = _get(player_url)
+        response.raise_for_status()
+        # Not streamed from response.raw: the cache has already read the whole
+        # body to store it (and re-feeding it breaks br decoding), and the parse
+        # worker needs plain bytes anyway, so .content is the only copy made
+        return response.content
+    except requests.RequestException as e:
+        log.error("Error fetching player page %s: %s", player_url, e)
+        return None
+
+
+def _parse_info_div(content):
+    """
+    Parses content only as far as the end of its #info div and returns that div,
+    or None if the page has none. The stat tables after it are never built.
+    """
+    parser = etree.HTMLPullParser(events=("end",), tag="div", encoding="utf-8")
+    for start in range(0, len(content), INFO_FEED_SIZE):
+        parser.feed(content[start : start + INFO_FEED_SIZE])
+        for _, div in parser.read_events():
+            if div.get("id") == "info":
+                return div
+    parser.close()
+    return None
+
+
+def _parse_player_html(player_url, content):
+    """
+    Extracts player details from a downloaded player page. This does no I/O, so
+    it can run in a worker process. Problems are returned as (level, msg, args)
+    log calls next to the player data rather than logged here, so the calling
+    process can log them wherever its handlers send them.
+    """
+    problems = []
     player_data = {
         "Name": None,
         "Pronunciation": None,
@@ -68,139 +324,50 @@ def parse_player_page(player_url):
         "Career_Length": None,
         "URL": player_url,
     }
+    if content is None:
+        return player_data, problems
 
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-    }
     try:
-        response = requests.get(player_url, headers=headers, timeout=15)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, "html.parser")
-
-        info_div = soup.find("div", id="info")
-        if not info_div:
-            print(f"    Could not find main info div for {player_url}")
-            return player_data
-
-        meta_div = info_div.find("div", id="meta")
-        if not meta_div:
-            print(f"    Could not find meta div for {player_url}")
-            return player_data
-
-        h1_tag = meta_div.find("h1")
-        content_holder_div = None
-        if h1_tag:
-            player_data["Name"] = h1_tag.get_text(strip=True)
-            content_holder_div = h1_tag.parent
-        else:
-            potential_holders = meta_div.find_all("div", recursive=False)
-            for div_child in potential_holders:
-                if "media-item" not in div_child.get("class", []):
-                    content_holder_div = div_child
-                    h1_in_holder = content_holder_div.find("h1")
-                    if h1_in_holder:
-                        player_data["Name"] = h1_in_holder.get_text(strip=True)
-                    break
-            if not content_holder_div:
-                content_holder_div = meta_div
-
-        if not content_holder_div:
-            print(
-                f"    Could not find content holder div within #meta for {player_url}"
+        info_div = _parse_info_div(content)
+        if info_div is None:
+            problems.append(
+                (logging.WARNING, "Could not find main info div for %s", (player_url,))
             )
-            if not player_data["Name"] and info_div.find("h1"):
-                player_data["Name"] = info_div.find("h1").get_text(strip=True)
-            return player_data
+            return player_data, problems
 
-        if not player_data["Name"] and content_holder_div.find("h1"):
-            player_data["Name"] = content_holder_div.find("h1").get_text(strip=True)
+        meta_divs = XPATH_META(info_div)
+        if not meta_divs:
+            problems.append(
+                (logging.WARNING, "Could not find meta div for %s", (player_url,))
+            )
+            return player_data, problems
+        meta_div = meta_divs[0]
 
-        paragraphs = content_holder_div.find_all("p", recursive=False)
+        h1_tags = XPATH_H1(meta_div)
+        if h1_tags:
+            player_data["Name"] = _text(h1_tags[0])
+            content_holder_div = h1_tags[0].getparent()
+        else:
+            content_divs = XPATH_CONTENT_DIVS(meta_div)
+            content_holder_div = content_divs[0] if content_divs else meta_div
 
-        found_pronunciation = False
         found_nicknames = False
         found_ht_wt = False
 
-        for p_tag in paragraphs:
-            strong_tag = p_tag.find("strong")
-            p_text_full = p_tag.get_text(strip=True).replace("\xa0", " ")
-
-            if strong_tag:
-                label = strong_tag.get_text(strip=True)
-                value_text = (
-                    "".join(
-                        (
-                            sibling.get_text(strip=True)
-                            if hasattr(sibling, "get_text")
-                            else str(sibling).strip()
-                        )
-                        for sibling in strong_tag.next_siblings
-                    )
-                    .strip()
-                    .lstrip(":")
-                    .strip()
-                )
-
-                if "Pronunciation" in label and not found_pronunciation:
-                    player_data["Pronunciation"] = value_text
-                    found_pronunciation = True
-                elif "Position:" in label or "Shoots:" in label:
-                    for part in p_text_full.split("▪"):
-                        if "Position:" in part:
-                            player_data["Position"] = part.split("Position:", 1)[
-                                -1
-                            ].strip()
-                        elif "Shoots:" in part:
-                            player_data["Shoots"] = part.split("Shoots:", 1)[-1].strip()
-                elif "Born:" in label:
-                    born_date_span = p_tag.find("span", id="necro-birth")
-                    if born_date_span:
-                        player_data["Born_Date"] = born_date_span.get_text(strip=True)
-
-                    location_parts = []
-                    start_node = born_date_span if born_date_span else strong_tag
-                    for elem in start_node.next_siblings:
-                        if elem.name == "span" and "f-i" in elem.get("class", []):
-                            break
-                        location_parts.append(
-                            elem.get_text(strip=True)
-                            if hasattr(elem, "get_text")
-                            else str(elem).strip()
-                        )
-                    location = " ".join(filter(None, location_parts)).strip()
-                    if location.lower().startswith("in "):
-                        location = location[3:]
-                    player_data["Born_Location"] = location
-                elif "College:" in label or "Colleges:" in label:
-                    college_links = p_tag.find_all("a")
-                    player_data["College"] = (
-                        ", ".join([a.get_text(strip=True) for a in college_links])
-                        if college_links
-                        else value_text
-                    )
-                elif "High School:" in label:
-                    hs_parts = [
-                        (
-                            elem.get_text(strip=True)
-                            if hasattr(elem, "get_text")
-                            else str(elem).strip()
-                        )
-                        for elem in strong_tag.next_siblings
-                    ]
-                    player_data["High School"] = (
-                        " ".join(filter(None, hs_parts)).lstrip(":").strip()
-                    )
-                elif "Draft:" in label:
-                    player_data["Draft"] = value_text
-                elif "NBA Debut:" in label:
-                    debut_link = p_tag.find("a")
-                    player_data["NBA_Debut"] = (
-                        debut_link.get_text(strip=True) if debut_link else value_text
-                    )
-                elif "Career Length:" in label:
-                    player_data["Career_Length"] = value_text
+        for p_tag in XPATH_PARAS(content_holder_div):
+            strong_tags = XPATH_STRONG(p_tag)
+
+            if strong_tags:
+                strong_tag = strong_tags[0]
+                label = _text(strong_tag)
+                handler = LABEL_HANDLERS.get(label.rstrip(":").strip())
+                if handler:
+                    value_parts = _sibling_texts(strong_tag)
+                    value_text = "".join(value_parts).strip().lstrip(":").strip()
+                    handler(player_data, p_tag, strong_tag, value_text, value_parts)
 
             else:
+                p_text_full = _text(p_tag).replace("\xa0", " ")
                 if (
                     not found_nicknames
                     and p_text_full.startswith("(")
@@ -210,10 +377,7 @@ def parse_player_page(player_url):
                     player_data["Nicknames"] = p_text_full
                     found_nicknames = True
                 elif not found_ht_wt:
-                    match_ht_wt = re.search(
-                        r'(\d+-\d+|\d+\'\d+"?)\s*,\s*(\d+lb)\s*\(([^,]+cm)\s*,\s*([^)]+kg)\)',
-                        p_text_full,
-                    )
+                    match_ht_wt = HT_WT_RE.search(p_text_full)
                     if match_ht_wt:
                         player_data["Height_Imperial"] = match_ht_wt.group(1)
                         player_data["Weight_Imperial"] = match_ht_wt.group(2)
@@ -221,64 +385,80 @@ def parse_player_page(player_url):
                         player_data["Weight_Metric"] = match_ht_wt.group(4).strip()
                         found_ht_wt = True
 
-    except requests.RequestException as e:
-        print(f"    Error fetching player page {player_url}: {e}")
-    except Exception as e:
-        print(f"    Error parsing player page {player_url}: {e}")
-        import traceback
+    except Exception:
+        problems.append(
+            (
+                logging.ERROR,
+                "Error parsing player page %s\n%s",
+                (player_url, traceback.format_exc().rstrip()),
+            )
+        )
+
+    return player_data, problems
 
-        traceback.print_exc()
 
+def _log_problems(problems):
+    for level, msg, args in problems:
+        log.log(level, msg, *args)
+
+
+def parse_player_html(player_url, content):
+    """Extracts player details from a downloaded player page, logging any problems."""
+    player_data, problems = _parse_player_html(player_url, content)
+    _log_problems(problems)
     return player_data
 
 
-def main():
-    all_player_data = []
-    letters_to_scrape = string.ascii_lowercase
-    total_players_scraped = 0  # Keep track of overall players for final report
-    max_players_per_letter = 100  # Set the limit per letter
-    REQUEST_DELAY = 3  # seconds, as per robots.txt
-
-    for letter in letters_to_scrape:
-        index_url = f"{BASE_URL}/players/{letter}/"
-        player_links = get_player_page_urls_from_index(index_url)
-        # Delay after fetching the index page, before processing its players
-        if (
-            player_links
-        ):  # Only sleep if we actually got links and will make more requests
-            time.sleep(REQUEST_DELAY)
-
-        players_scraped_this_letter = 0  # Reset counter for each new letter
-
-        for i, player_url in enumerate(player_links):
-            if players_scraped_this_letter >= max_players_per_letter:
-                print(
-                    f"  Reached limit of {max_players_per_letter} players for letter '{letter.upper()}'. Moving to next letter."
-                )
-                break  # Break out of the player loop for the current letter
-
-            player_details = parse_player_page(player_url)
-            all_player_data.append(player_details)
-            players_scraped_this_letter += 1
-            total_players_scraped += 1
-            print(
-                f"    Scraped player #{players_scraped_this_letter} for letter '{letter.upper()}' (Total: {total_players_scraped}): {player_details.get('Name', 'Unknown Name')}"
+def parse_player_page(player_url):
+    return parse_player_html(player_url, fetch_player_page(player_url))
+
+
+async def fetch_index_pages(letters):
+    """
+    Fetches the player index page of every letter concurrently and returns the
+    player URLs found on each, in the same order as letters. Requests are paced
+    by RATE_LIMITER like the player pages.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def fetch_index(letter):
+        async with semaphore:
+            return await asyncio.to_thread(
+                get_player_page_urls_from_index, f"{BASE_URL}/players/{letter}/"
             )
-            # Delay after fetching each player page, but only if we are not at the letter limit yet
-            if (
-                players_scraped_this_letter < max_players_per_letter
-                and i < len(player_links) - 1
-            ):  # also check if it's not the last player in the list
-                time.sleep(REQUEST_DELAY)
-
-        print(
-            f"Finished letter {letter.upper()}. Scraped {players_scraped_this_letter} players for this letter."
+
+    return await asyncio.gather(*(fetch_index(letter) for letter in letters))
+
+
+async def scrape_player_pages(player_urls, on_player, parse_executor=None):
+    """
+    Fetches and parses player pages concurrently, calling on_player(player_details)
+    for each page in input order as soon as it and the pages before it are done.
+    RATE_LIMITER still spaces requests REQUEST_DELAY seconds apart, but up to
+    MAX_CONCURRENT_REQUESTS can be in flight so round trips and parsing overlap
+    with the delay instead of adding to it. Parsing runs on parse_executor (e.g. a
+    process pool) when given, otherwise on the default thread pool.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def fetch_and_parse(player_url):
+        async with semaphore:
+            content = await asyncio.to_thread(fetch_player_page, player_url)
+        player_data, problems = await loop.run_in_executor(
+            parse_executor, _parse_player_html, player_url, content
         )
-        # The delay after get_player_page_urls_from_index handles the pause before the *next* letter's index fetch.
-        # No extra sleep explicitly needed here unless there was non-request work between letters.
+        # Logged here rather than in the worker, whose records would not reach
+        # this process's handlers (e.g. the Dagster run log)
+        _log_problems(problems)
+        return player_data
 
-    df = pd.DataFrame(all_player_data)
+    tasks = [asyncio.create_task(fetch_and_parse(url)) for url in player_urls]
+    for task in tasks:
+        on_player(await task)
 
+
+def main():
     column_order = [
         "Name",
         "Pronunciation",
@@ -298,29 +478,84 @@ def main():
         "Career_Length",
         "URL",
     ]
-    for col in column_order:
-        if col not in df.columns:
-            df[col] = None
-    df = df[column_order]
+    columns = {col: [] for col in column_order}
+    letters_to_scrape = string.ascii_lowercase
+    total_players_scraped = 0  # Keep track of overall players for final report
+    max_players_per_letter = 100  # Set the limit per letter
 
     csv_filename = (
         f"basketball_reference_players_max{max_players_per_letter}_per_letter.csv"
     )
-    try:
-        df.to_csv(csv_filename, index=False, encoding="utf-8-sig")
-        print(f"\nSuccessfully saved data to {csv_filename}")
-    except Exception as e:
-        print(f"\nError saving to CSV: {e}")
-
-    print(f"\nScraped a total of {total_players_scraped} players.")
-    if not df.empty:
-        print("\nFirst 5 rows of data:")
-        print(df.head().to_string())
-    else:
-        print("No data was scraped.")
+    # All index pages are fetched first so the player pages of every letter can
+    # be scraped in one pass instead of stalling on each letter's index
+    letter_links = asyncio.run(fetch_index_pages(letters_to_scrape))
+    player_links = []
+    player_letters = []  # Letter of each entry in player_links
+    letter_totals = {}
+    for letter, links in zip(letters_to_scrape, letter_links):
+        if len(links) > max_players_per_letter:
+            log.info(
+                "Limiting letter '%s' to %d of %d players.",
+                letter.upper(),
+                max_players_per_letter,
+                len(links),
+            )
+            links = links[:max_players_per_letter]
+        player_links.extend(links)
+        player_letters.extend([letter] * len(links))
+        letter_totals[letter] = len(links)
+        if not links:
+            log.info("Finished letter %s. Scraped 0 players.", letter.upper())
+    players_scraped_per_letter = dict.fromkeys(letters_to_scrape, 0)
+
+    def record_player(player_details):
+        nonlocal total_players_scraped
+        writer.writerow(player_details)
+        csv_file.flush()
+        for col in column_order:
+            columns[col].append(player_details.get(col))
+        letter = player_letters[total_players_scraped]
+        players_scraped_per_letter[letter] += 1
+        total_players_scraped += 1
+        log.debug(
+            "Scraped player #%d for letter '%s' (Total: %d): %s",
+            players_scraped_per_letter[letter],
+            letter.upper(),
+            total_players_scraped,
+            player_details.get("Name", "Unknown Name"),
+        )
+        if players_scraped_per_letter[letter] == letter_totals[letter]:
+            log.info(
+                "Finished letter %s. Scraped %d players.",
+                letter.upper(),
+                players_scraped_per_letter[letter],
+            )
+
+    # The CSV is only opened (and any previous one replaced) once the index pages
+    # are in. Rows are written as they are scraped, so a crash keeps everything so
+    # far and progress can be followed with tail -f. Parsing runs on a small pool
+    # of spawned worker processes (see PARSE_WORKERS)
+    with open(
+        csv_filename, "w", encoding="utf-8", newline=""
+    ) as csv_file, ProcessPoolExecutor(
+        max_workers=PARSE_WORKERS, mp_context=multiprocessing.get_context("spawn")
+    ) as parse_executor:
+        writer = csv.DictWriter(csv_file, fieldnames=column_order, lineterminator="\n")
+        writer.writeheader()
+        asyncio.run(scrape_player_pages(player_links, record_player, parse_executor))
+    log.info("Saved data to %s", csv_filename)
+
+    # Rows are collected column-wise so the frame is built without per-row dicts
+    df = pd.DataFrame(columns, copy=False)
+
+    log.info("Scraped a total of %d players.", total_players_scraped)
+    if df.empty:
+        log.warning("No data was scraped.")
 
     return df
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     df = main()
+    print(df.head().to_string())
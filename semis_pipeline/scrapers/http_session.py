@@ -0,0 +1,26 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    # gzip/deflate, plus br when brotli is installed for urllib3 to decode it
+    "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"],
+}
+
+
+def configure_session(session=None, **adapter_kwargs):
+    """
+    Sets the shared scraper headers on session (a new requests.Session by default)
+    and mounts an HTTPS adapter that retries rate limiting and server errors with
+    backoff. Extra keyword arguments go to the HTTPAdapter, e.g. pool sizes.
+    """
+    if session is None:
+        session = requests.Session()
+    session.headers.update(HEADERS)
+    retries = Retry(
+        total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]
+    )
+    session.mount("https://", HTTPAdapter(max_retries=retries, **adapter_kwargs))
+    return session
@@ -11,24 +11,20 @@ from pathlib import Path
 
 
 def setup_environment():
-    """Install required packages if not already installed"""
-    required_packages = [
-        "dagster",
-        "dagster-webserver",
-        "pandas",
-        "requests",
-        "beautifulsoup4",
-    ]
+    """Install required packages if requirements.txt changed since the last install"""
+    requirements = Path("requirements.txt")
+    stamp = Path(".deps.stamp")
+
+    if stamp.exists() and stamp.stat().st_mtime >= requirements.stat().st_mtime:
+        print("✓ Required packages are already installed")
+        return
 
-    print("Checking and installing required packages...")
-    for package in required_packages:
-        try:
-            __import__(package.replace("-", "_"))
-            print(f"✓ {package} is already installed")
-        except ImportError:
-            print(f"Installing {package}...")
-            subprocess.check_call([sys.executable, "-m", "pip", "install", package])
-            print(f"✓ {package} installed successfully")
+    print("Installing required packages...")
+    subprocess.check_call(
+        [sys.executable, "-m", "pip", "install", "-q", "-r", str(requirements)]
+    )
+    stamp.touch()
+    print("✓ Required packages installed successfully")
 
 
 def create_directories():